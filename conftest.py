@@ -0,0 +1,52 @@
+"""
+Shared pytest setup for the top-level test modules
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+# Add the project root to Python path
+project_root = Path(__file__).parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+@lru_cache(maxsize=None)
+def _load_env() -> bool:
+    """Load environment variables from .env once per process."""
+    from dotenv import load_dotenv
+    return load_dotenv()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def dotenv_loaded():
+    """Load environment variables before any test runs."""
+    return _load_env()
+
+
+def make_claude_ingestor():
+    """Create a Claude conversation ingestor configured from the environment."""
+    from takeout_ingestor.ingestors.claude_conversations import ClaudeConversationIngestor
+    return ClaudeConversationIngestor(
+        batch_size=int(os.getenv("INGEST_BATCH", "10000")),
+        pixeltable_home=os.getenv('PIXELTABLE_HOME')
+    )
+
+
+@pytest.fixture(scope="session")
+def claude_ingestor(dotenv_loaded):
+    """Ingestor shared by the ingestion tests so Pixeltable is set up once."""
+    ingestor = make_claude_ingestor()
+    yield ingestor
+    ingestor.cleanup()
+
+
+@pytest.fixture(scope="session")
+def ensure_tables(claude_ingestor):
+    """Create the Pixeltable schema up front so tests don't pay for it."""
+    claude_ingestor.initialize_backend()
+    return claude_ingestor
@@ -6,13 +6,64 @@ Focused on Pixeltable backend with unified error handling.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable, Iterator, Deque
+from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
 import logging
 import json
 from enum import Enum
 import os
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Error messages retained by IngestorProgress for reporting
+_MAX_TRACKED_ERRORS = 100
+
+# Batches buffered between pipeline stages (i.e. 2 * batch_size records)
+_PIPELINE_QUEUE_BATCHES = 2
+
+# How often a blocked pipeline stage checks whether it should stop
+_QUEUE_POLL_INTERVAL = 0.1
+
+# Upper bound on the default transform pool; transforms mostly wait on temp-file I/O
+_MAX_TRANSFORM_WORKERS = 32
+
+# Sentinel telling the next pipeline stage that its producer has finished
+_STAGE_DONE = object()
+
+
+def _queue_put(q: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    """Put an item on a bounded queue, giving up if the pipeline stops."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_QUEUE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _queue_get(q: queue.Queue, stop: threading.Event) -> Any:
+    """Get an item from a queue, returning _STAGE_DONE if the pipeline stops."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=_QUEUE_POLL_INTERVAL)
+        except queue.Empty:
+            continue
+    return _STAGE_DONE
+
+
+class _PartialBatchError(Exception):
+    """A batch store failed after the first `stored` records were written."""
+    
+    def __init__(self, stored: int, cause: Exception):
+        super().__init__(str(cause))
+        self.stored = stored
 
 
 class IngestorStatus(Enum):
@@ -27,15 +78,29 @@ class IngestorStatus(Enum):
 class IngestorProgress:
     """Track ingestion progress with resumable state."""
     
+    __slots__ = (
+        'total_items', 'processed_items', 'failed_items', 'start_time',
+        'status', 'errors', 'metadata', '_error_count', '_last_update', '_lock'
+    )
+    
     def __init__(self, total_items: int = 0):
         self.total_items = total_items
         self.processed_items = 0
         self.failed_items = 0
         self.start_time = datetime.now()
-        self.last_update = self.start_time
         self.status = IngestorStatus.PENDING
-        self.errors: List[str] = []
+        # Only the most recent errors are kept; _error_count has the total
+        self.errors: Deque[str] = deque(maxlen=_MAX_TRACKED_ERRORS)
         self.metadata: Dict[str, Any] = {}
+        self._error_count = 0
+        self._last_update = time.time()
+        # Pipeline stages update progress from several threads
+        self._lock = threading.Lock()
+    
+    @property
+    def last_update(self) -> datetime:
+        """Time of the most recent progress update."""
+        return datetime.fromtimestamp(self._last_update)
     
     @property
     def completion_percentage(self) -> float:
@@ -51,20 +116,33 @@ class IngestorProgress:
             return 0.0
         return ((self.processed_items - self.failed_items) / self.processed_items) * 100
     
+    def add_items(self, count: int):
+        """Grow the expected total as the source is read."""
+        with self._lock:
+            self.total_items += count
+    
     def update(self, processed: int = 1, failed: int = 0, metadata: Optional[Dict] = None):
         """Update progress counters."""
-        self.processed_items += processed
-        self.failed_items += failed
-        self.last_update = datetime.now()
-        if metadata:
-            self.metadata.update(metadata)
+        with self._lock:
+            self.processed_items += processed
+            self.failed_items += failed
+            self._last_update = time.time()
+            if metadata:
+                self.metadata.update(metadata)
     
     def add_error(self, error: str):
         """Add an error message."""
-        self.errors.append(f"{datetime.now().isoformat()}: {error}")
+        with self._lock:
+            self.errors.append(f"{datetime.now().isoformat()}: {error}")
+            self._error_count += 1
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        with self._lock:
+            recent_errors = list(self.errors)[-5:]  # Last 5 errors
+            error_count = self._error_count
+            metadata = dict(self.metadata)
+        
         return {
             "total_items": self.total_items,
             "processed_items": self.processed_items,
@@ -74,9 +152,9 @@ class IngestorProgress:
             "status": self.status.value,
             "start_time": self.start_time.isoformat(),
             "last_update": self.last_update.isoformat(),
-            "error_count": len(self.errors),
-            "recent_errors": self.errors[-5:],  # Last 5 errors
-            "metadata": self.metadata
+            "error_count": error_count,
+            "recent_errors": recent_errors,
+            "metadata": metadata
         }
 
 
@@ -95,7 +173,8 @@ class BaseIngestor(ABC):
         self, 
         batch_size: int = 100,
         enable_progress_tracking: bool = True,
-        pixeltable_home: Optional[str] = None
+        pixeltable_home: Optional[str] = None,
+        transform_workers: Optional[int] = None
     ):
         """
         Initialize the base ingestor.
@@ -104,9 +183,14 @@ class BaseIngestor(ABC):
             batch_size: Number of items to process in each batch
             enable_progress_tracking: Whether to track progress
             pixeltable_home: Override default Pixeltable home directory
+            transform_workers: Number of threads transforming records
+                (defaults to 4 per CPU, capped at 32)
         """
         self.batch_size = batch_size
         self.enable_progress_tracking = enable_progress_tracking
+        self.transform_workers = transform_workers or min(
+            _MAX_TRANSFORM_WORKERS, (os.cpu_count() or 1) * 4
+        )
         
         # Set up logging
         self.logger = logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
@@ -114,6 +198,9 @@ class BaseIngestor(ABC):
         # Initialize backend connections
         self.pixeltable_client = None
         
+        # Persistent transform pool, created with the backend
+        self._transform_executor: Optional[ThreadPoolExecutor] = None
+        
         # Progress tracking
         self.progress = IngestorProgress() if enable_progress_tracking else None
         
@@ -121,7 +208,7 @@ class BaseIngestor(ABC):
         if pixeltable_home:
             os.environ['PIXELTABLE_HOME'] = str(pixeltable_home)
         
-        self.logger.info(f"Initialized {self.__class__.__name__}")
+        self.logger.info("Initialized %s", self.__class__.__name__)
     
     @abstractmethod
     def get_supported_formats(self) -> List[str]:
@@ -147,25 +234,30 @@ class BaseIngestor(ABC):
         pass
     
     @abstractmethod
-    def parse_source(self, source_path: str) -> List[Dict[str, Any]]:
+    def parse_source(self, source_path: str) -> Iterator[Dict[str, Any]]:
         """
         Parse the source data into a standardized format.
         
+        Implementations should yield records as they are parsed so large
+        sources never have to be held in memory all at once.
+        
         Args:
             source_path: Path to the source data
             
         Returns:
-            List of normalized data records
+            Iterator of normalized data records
         """
         pass
     
     @abstractmethod
-    def transform_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_record(self, record: Dict[str, Any], ingested_at: Optional[str] = None) -> Dict[str, Any]:
         """
         Transform a single record into the target schema.
         
         Args:
             record: Raw data record
+            ingested_at: ISO timestamp shared by the record's batch
+                (defaults to the current time)
             
         Returns:
             Transformed record ready for storage
@@ -181,13 +273,19 @@ class BaseIngestor(ABC):
             # Ensure required tables exist
             self._ensure_pixeltable_schema()
             
+            if self._transform_executor is None:
+                self._transform_executor = ThreadPoolExecutor(
+                    max_workers=self.transform_workers,
+                    thread_name_prefix="ingest-transform"
+                )
+            
             self.logger.info("Pixeltable backend initialized")
             
         except ImportError:
             self.logger.error("Pixeltable not available - install with: pip install pixeltable")
             raise
         except Exception as e:
-            self.logger.error(f"Pixeltable initialization failed: {e}")
+            self.logger.error("Pixeltable initialization failed: %s", e)
             raise
     
     @abstractmethod
@@ -199,7 +297,8 @@ class BaseIngestor(ABC):
         self, 
         source_path: str,
         resume: bool = False,
-        validate_only: bool = False
+        validate_only: bool = False,
+        records: Optional[Iterable[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Main ingestion method.
@@ -208,12 +307,13 @@ class BaseIngestor(ABC):
             source_path: Path to the source data
             resume: Whether to resume from previous progress
             validate_only: Only validate, don't actually ingest
+            records: Records already parsed from source_path; skips parsing it again
             
         Returns:
             Ingestion summary
         """
         try:
-            self.logger.info(f"Starting ingestion of {source_path}")
+            self.logger.info("Starting ingestion of %s", source_path)
             
             # Initialize backend
             self.initialize_backend()
@@ -223,55 +323,43 @@ class BaseIngestor(ABC):
             if not is_valid:
                 raise ValueError(f"Source validation failed: {error_msg}")
             
-            # Parse source data
-            records = self.parse_source(source_path)
+            # Parse source data (lazily - records are pulled batch by batch)
+            if records is None:
+                records = self.parse_source(source_path)
             
             if self.progress:
-                self.progress.total_items = len(records)
                 self.progress.status = IngestorStatus.RUNNING
             
-            self.logger.info(f"Parsed {len(records)} records from source")
-            
             if validate_only:
+                record_count = 0
+                sample_record = None
+                for record in records:
+                    if sample_record is None:
+                        sample_record = record
+                    record_count += 1
+                
+                if self.progress:
+                    self.progress.total_items = record_count
+                
+                self.logger.info("Parsed %d records from source", record_count)
                 return {
                     "validation": "passed",
-                    "record_count": len(records),
-                    "sample_record": records[0] if records else None
+                    "record_count": record_count,
+                    "sample_record": sample_record
                 }
             
-            # Process in batches
-            processed_count = 0
-            failed_count = 0
-            
-            for i in range(0, len(records), self.batch_size):
-                batch = records[i:i + self.batch_size]
-                
-                try:
-                    batch_results = self._process_batch(batch)
-                    processed_count += batch_results["processed"]
-                    failed_count += batch_results["failed"]
-                    
-                    if self.progress:
-                        self.progress.update(
-                            processed=batch_results["processed"],
-                            failed=batch_results["failed"]
-                        )
-                    
-                    self.logger.info(f"Processed batch {i//self.batch_size + 1}, "
-                                   f"records: {processed_count}/{len(records)}")
-                
-                except Exception as e:
-                    self.logger.error(f"Batch processing failed: {e}")
-                    if self.progress:
-                        self.progress.add_error(f"Batch {i//self.batch_size + 1}: {e}")
-                    failed_count += len(batch)
+            # Run the load -> transform -> upsert pipeline
+            counts = self._run_pipeline(records)
+            total_records = counts["total"]
+            processed_count = counts["processed"]
+            failed_count = counts["failed"]
             
             # Update final status
             if self.progress:
                 self.progress.status = IngestorStatus.COMPLETED if failed_count == 0 else IngestorStatus.FAILED
             
             summary = {
-                "total_records": len(records),
+                "total_records": total_records,
                 "processed_records": processed_count,
                 "failed_records": failed_count,
                 "success_rate": ((processed_count - failed_count) / processed_count * 100) if processed_count > 0 else 0,
@@ -279,41 +367,259 @@ class BaseIngestor(ABC):
                 "progress": self.progress.to_dict() if self.progress else None
             }
             
-            self.logger.info(f"Ingestion completed: {summary}")
+            self.logger.info("Ingestion completed: %s", summary)
             return summary
             
         except Exception as e:
-            self.logger.error(f"Ingestion failed: {e}")
+            self.logger.error("Ingestion failed: %s", e)
             if self.progress:
                 self.progress.status = IngestorStatus.FAILED
                 self.progress.add_error(str(e))
             raise
     
-    def _process_batch(self, batch: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _iter_batches(self, records: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
         """
-        Process a batch of records.
+        Group a stream of records into lists of at most batch_size.
         
         Args:
-            batch: List of records to process
+            records: Records to group, consumed lazily
             
         Returns:
-            Dictionary with processed and failed counts
+            Iterator of record batches
         """
-        processed = 0
-        failed = 0
+        batch: List[Dict[str, Any]] = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
         
-        for record in batch:
+        if batch:
+            yield batch
+    
+    def _run_pipeline(self, records: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Run records through the load -> transform -> upsert pipeline.
+        
+        Each stage runs on its own thread and hands batches to the next over
+        a bounded queue, so parsing, transformation and Pixeltable writes
+        overlap while backpressure keeps memory flat. The transform stage
+        fans each batch out over the transform pool. Embeddings are computed
+        by Pixeltable as part of the insert, so they belong to the upsert
+        stage, which runs on the calling thread.
+        
+        Args:
+            records: Records to ingest, consumed lazily
+            
+        Returns:
+            Dictionary with total, processed and failed counts
+        """
+        if self.progress:
+            self.progress.total_items = 0
+        
+        load_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_QUEUE_BATCHES)
+        store_queue: queue.Queue = queue.Queue(maxsize=_PIPELINE_QUEUE_BATCHES)
+        stop = threading.Event()
+        
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ingest-stage") as stages:
+            load_future = stages.submit(self._load_stage, records, load_queue, stop)
+            transform_future = stages.submit(self._transform_stage, load_queue, store_queue, stop)
+            
+            try:
+                counts = self._upsert_stage(store_queue, stop)
+            finally:
+                # Unblock any stage still waiting on a queue
+                stop.set()
+        
+        # Surface errors raised while parsing the source
+        load_future.result()
+        transform_future.result()
+        
+        return counts
+    
+    def _load_stage(
+        self,
+        records: Iterable[Dict[str, Any]],
+        load_queue: queue.Queue,
+        stop: threading.Event
+    ):
+        """Pull records from the parser and queue them in batches."""
+        try:
+            for batch_number, batch in enumerate(self._iter_batches(records), start=1):
+                if self.progress:
+                    self.progress.add_items(len(batch))
+                if not _queue_put(load_queue, (batch_number, batch), stop):
+                    return
+        finally:
+            _queue_put(load_queue, _STAGE_DONE, stop)
+    
+    def _transform_stage(self, load_queue: queue.Queue, store_queue: queue.Queue, stop: threading.Event):
+        """Transform queued batches and hand them to the upsert stage."""
+        while True:
+            item = _queue_get(load_queue, stop)
+            if item is _STAGE_DONE:
+                _queue_put(store_queue, _STAGE_DONE, stop)
+                return
+            
+            batch_number, batch = item
+            try:
+                transformed, failed = self._transform_batch(batch)
+                error = None
+            except Exception as e:
+                transformed, failed, error = [], len(batch), e
+            
+            if not _queue_put(store_queue, (batch_number, len(batch), transformed, failed, error), stop):
+                return
+    
+    def _upsert_stage(self, store_queue: queue.Queue, stop: threading.Event) -> Dict[str, int]:
+        """Store transformed batches until the transform stage is done."""
+        total_records = 0
+        processed_count = 0
+        failed_count = 0
+        
+        while True:
+            item = _queue_get(store_queue, stop)
+            if item is _STAGE_DONE:
+                break
+            
+            batch_number, batch_len, transformed, transform_failed, error = item
+            total_records += batch_len
+            
             try:
-                # Transform record
-                transformed = self.transform_record(record)
+                if error is not None:
+                    raise error
                 
-                # Store in Pixeltable
-                self._store_pixeltable(transformed)
+                batch_results = self._store_batch(transformed)
+                batch_results["failed"] += transform_failed
+                processed_count += batch_results["processed"]
+                failed_count += batch_results["failed"]
                 
-                processed += 1
+                if self.progress:
+                    self.progress.update(
+                        processed=batch_results["processed"],
+                        failed=batch_results["failed"]
+                    )
                 
+                self.logger.info("Processed batch %d, records processed so far: %d of %d read",
+                                 batch_number, processed_count, total_records)
+            
             except Exception as e:
-                self.logger.warning(f"Failed to process record: {e}")
+                self.logger.error("Batch processing failed: %s", e)
+                if self.progress:
+                    self.progress.add_error(f"Batch {batch_number}: {e}")
+                failed_count += batch_len
+        
+        return {"total": total_records, "processed": processed_count, "failed": failed_count}
+    
+    def _transform_batch(self, batch: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Transform a batch of records, skipping the ones that fail.
+        
+        Args:
+            batch: List of records to transform
+            
+        Returns:
+            Tuple of (transformed records, failed count)
+        """
+        # One timestamp per batch; sub-second precision is meaningless here
+        transform = functools.partial(self._transform_shard, ingested_at=datetime.now().isoformat())
+        shards = self._shard_batch(batch)
+        
+        if self._transform_executor is not None:
+            results = self._transform_executor.map(transform, shards)
+        else:
+            results = map(transform, shards)
+        
+        transformed = []
+        failed = 0
+        
+        for shard_results in results:
+            for record, error in shard_results:
+                if error is None:
+                    transformed.append(record)
+                else:
+                    self.logger.warning("Failed to transform record: %s", error)
+                    if self.progress:
+                        self.progress.add_error(f"Record processing: {error}")
+                    failed += 1
+        
+        return transformed, failed
+    
+    def _shard_key(self, record: Dict[str, Any]) -> Any:
+        """
+        Return the ordering key for a record within a batch.
+        
+        Records with equal keys are transformed sequentially, in batch order;
+        different keys may be transformed concurrently. By default every
+        record is independent.
+        
+        Args:
+            record: Raw data record
+            
+        Returns:
+            Hashable shard key
+        """
+        return id(record)
+    
+    def _shard_batch(self, batch: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group a batch into shards by _shard_key, keeping first-seen order."""
+        shards: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for record in batch:
+            try:
+                key = self._shard_key(record)
+                shard = shards[key]
+            except Exception:
+                # A malformed record gets its own shard so transform_record
+                # reports it alone instead of failing the whole batch
+                shard = shards[('_unkeyed', id(record))]
+            shard.append(record)
+        return list(shards.values())
+    
+    def _transform_shard(
+        self,
+        shard: List[Dict[str, Any]],
+        ingested_at: Optional[str] = None
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+        """Transform a shard's records in order, capturing per-record errors."""
+        results = []
+        for record in shard:
+            try:
+                results.append((self.transform_record(record, ingested_at=ingested_at), None))
+            except Exception as e:
+                results.append((None, e))
+        return results
+    
+    def _store_batch(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Store a batch of transformed records in Pixeltable.
+        
+        Args:
+            records: Transformed records to store
+            
+        Returns:
+            Dictionary with processed and failed counts
+        """
+        if not records:
+            return {"processed": 0, "failed": 0}
+        
+        try:
+            self._store_pixeltable_batch(records)
+            return {"processed": len(records), "failed": 0}
+        except Exception as e:
+            # Fall back to row-by-row inserts to isolate the failing records,
+            # skipping any the batch store already wrote
+            self.logger.warning("Batch insert failed, retrying records individually: %s", e)
+            stored = e.stored if isinstance(e, _PartialBatchError) else 0
+        
+        processed = stored
+        failed = 0
+        
+        for record in records[stored:]:
+            try:
+                self._store_pixeltable(record)
+                processed += 1
+            except Exception as e:
+                self.logger.warning("Failed to process record: %s", e)
                 if self.progress:
                     self.progress.add_error(f"Record processing: {e}")
                 failed += 1
@@ -325,6 +631,24 @@ class BaseIngestor(ABC):
         """Store a record in Pixeltable."""
         pass
     
+    def _store_pixeltable_batch(self, records: List[Dict[str, Any]]):
+        """
+        Store a batch of records in Pixeltable with a single insert.
+        
+        Overrides must be all-or-nothing: if they raise, every record is
+        retried one at a time through _store_pixeltable. The default stores
+        records one by one and, on failure, reports how many were already
+        written so only the rest are retried.
+        
+        Args:
+            records: Transformed records to store
+        """
+        for stored, record in enumerate(records):
+            try:
+                self._store_pixeltable(record)
+            except Exception as e:
+                raise _PartialBatchError(stored, e) from e
+    
     def get_progress(self) -> Optional[Dict[str, Any]]:
         """Get current ingestion progress."""
         return self.progress.to_dict() if self.progress else None
@@ -346,6 +670,10 @@ class BaseIngestor(ABC):
         # Pixeltable cleanup if needed
         self.pixeltable_client = None
         
+        if self._transform_executor is not None:
+            self._transform_executor.shutdown(wait=True)
+            self._transform_executor = None
+        
         self.logger.info("Cleanup completed")
     
     def __enter__(self):
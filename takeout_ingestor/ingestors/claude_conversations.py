@@ -5,21 +5,115 @@ Ingests Claude conversations as text documents into Pixeltable's document search
 Uses unified document table for consistent search experience.
 """
 
-import json
+import codecs
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator, Union
 from pathlib import Path
 from datetime import datetime
 import tempfile
+import io
+import mmap
 import os
+import shutil
+import threading
+import time
 
-import pixeltable as pxt
-from pixeltable.iterators import DocumentSplitter
-from pixeltable.functions.huggingface import sentence_transformer
+import ijson
+import orjson
 
 from .base import BaseIngestor
 
 
+# Matches any byte that bytes.strip() would keep
+_NON_WHITESPACE_RE = re.compile(rb'\S')
+
+# Exports up to this size are decoded in one orjson call; larger ones are streamed
+_JSON_WHOLE_PARSE_LIMIT = 64 * 1024 * 1024
+
+# Line between a temp document's metadata header and the conversation text
+_HEADER_SEPARATOR = "\n" + "=" * 50 + "\n\n"
+
+
+class _SafeTitleTable(dict):
+    """
+    str.translate table mapping filename-unsafe characters to '_'.
+    
+    Keeps word characters (as matched by the regex \\w), '-' and '.',
+    filling entries in lazily so any Unicode title can be translated.
+    """
+    
+    def __missing__(self, codepoint: int) -> Union[int, str]:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in "-_." else "_"
+        self[codepoint] = value
+        return value
+
+
+_SAFE_TITLE_TABLE = _SafeTitleTable()
+
+# Speaker labels that identify a conversation transcript (case-insensitive)
+_CONVERSATION_MARKER_RE = re.compile(rb'(?i)(?:human|assistant|claude|user):')
+
+# Run temp directories untouched for this long are assumed abandoned
+_STALE_RUN_DIR_AGE = 24 * 60 * 60
+
+# Leading bytes checked for markers before falling back to the whole file
+_MARKER_SCAN_PREFIX = 64 * 1024
+
+
+def _has_conversation_markers(content: bytes) -> bool:
+    """Check raw file bytes for speaker markers in a single regex pass."""
+    if _CONVERSATION_MARKER_RE.search(content, 0, _MARKER_SCAN_PREFIX):
+        return True
+    if len(content) <= _MARKER_SCAN_PREFIX:
+        return False
+    # Back up by more than the longest marker to catch one spanning the boundary
+    return _CONVERSATION_MARKER_RE.search(content, _MARKER_SCAN_PREFIX - 16) is not None
+
+
+# Bytes decoded per step when checking that a text source is valid UTF-8
+_UTF8_CHECK_CHUNK = 1024 * 1024
+
+
+def _find_utf8_error(content: mmap.mmap) -> Optional[str]:
+    """Check that mapped bytes are valid UTF-8 without decoding them all at once."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    size = len(content)
+    for start in range(0, size, _UTF8_CHECK_CHUNK):
+        end = start + _UTF8_CHECK_CHUNK
+        try:
+            decoder.decode(content[start:end], final=end >= size)
+        except UnicodeDecodeError as e:
+            return f"invalid UTF-8 near byte {start + e.start}: {e.reason}"
+    return None
+
+
+# Canonical speaker names, keyed by lowercased message role
+_ROLE_MAP = {
+    'human': 'Human',
+    'user': 'Human',
+    'assistant': 'Assistant',
+    'claude': 'Assistant',
+}
+
+
+
+class _MappedReader:
+    """File-like reader over a memory map with its own read position."""
+    
+    __slots__ = ('_mm', '_pos')
+    
+    def __init__(self, mm: mmap.mmap):
+        self._mm = mm
+        self._pos = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        start = self._pos
+        end = len(self._mm) if size is None or size < 0 else min(start + size, len(self._mm))
+        self._pos = end
+        return self._mm[start:end]
+
+
 class ClaudeConversationIngestor(BaseIngestor):
     """
     Ingest Claude conversations into Pixeltable's document search pipeline.
@@ -28,9 +122,35 @@ class ClaudeConversationIngestor(BaseIngestor):
     document processing, chunking, and embedding capabilities.
     """
     
+    # Parser method for each supported file extension
+    _PARSERS = {
+        ".json": "_parse_json_conversations",
+        ".txt": "_parse_text_conversations",
+        ".md": "_parse_text_conversations",
+    }
+    _SUPPORTED_FORMATS = frozenset(_PARSERS)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        
+        # Handle to the documents table, cached by _ensure_pixeltable_schema
+        self._table = None
+        
+        # Set once the table, chunks view and embedding index all exist, so a
+        # failed view or index setup is retried on the next ingest
+        self._schema_ready = False
+        
+        # Per-run directory for temp documents, created once on first use
+        self._temp_doc_dir: Optional[Path] = None
+        self._temp_doc_dir_lock = threading.Lock()
+        
+        # Memory map of the current source, shared by validate and parse
+        self._source_mm: Optional[mmap.mmap] = None
+        self._source_key: Optional[Tuple[str, int, int]] = None
+    
     def get_supported_formats(self) -> List[str]:
         """Return supported file formats."""
-        return [".txt", ".json", ".md"]
+        return sorted(self._SUPPORTED_FORMATS)
     
     def get_table_name(self) -> str:
         """Return the Pixeltable table name."""
@@ -43,26 +163,30 @@ class ClaudeConversationIngestor(BaseIngestor):
         if not path.exists():
             return False, f"Source path does not exist: {source_path}"
         
-        if path.suffix.lower() not in self.get_supported_formats():
+        if path.suffix.lower() not in self._SUPPORTED_FORMATS:
             return False, f"Unsupported file format: {path.suffix}"
         
         # Basic content validation
         try:
-            content = path.read_text(encoding='utf-8')
-            if len(content.strip()) == 0:
+            content = self._map_source(path)
+            first_char = _NON_WHITESPACE_RE.search(content) if content is not None else None
+            if first_char is None:
                 return False, "File is empty"
             
-            # Check if it's JSON with conversation structure
-            if path.suffix.lower() == '.json':
-                try:
-                    data = json.loads(content)
-                    if isinstance(data, (dict, list)):
-                        return True, None
-                except json.JSONDecodeError:
-                    pass
+            # Check if it's JSON with conversation structure. Only the opening
+            # byte is checked here; a full parse happens while ingesting (or
+            # in validate_only mode), so this stays O(1) on large exports.
+            if path.suffix.lower() == '.json' and first_char.group() in (b'{', b'['):
+                return True, None
+            
+            # Text is stored decoded, so reject files that aren't UTF-8 now
+            # rather than failing on the loader thread mid-ingest
+            utf8_error = _find_utf8_error(content)
+            if utf8_error is not None:
+                return False, f"Error reading file: {utf8_error}"
             
             # Look for conversation markers in text files
-            if any(marker in content.lower() for marker in ["human:", "assistant:", "claude:", "user:"]):
+            if _has_conversation_markers(content):
                 return True, None
             
             # Accept any text file for now
@@ -71,50 +195,172 @@ class ClaudeConversationIngestor(BaseIngestor):
         except Exception as e:
             return False, f"Error reading file: {e}"
     
-    def parse_source(self, source_path: str) -> List[Dict[str, Any]]:
-        """Parse Claude conversations and convert to document records."""
+    def parse_source(self, source_path: str) -> Iterator[Dict[str, Any]]:
+        """Parse Claude conversations and yield document records one at a time."""
         path = Path(source_path)
-        content = path.read_text(encoding='utf-8')
+        # Reuses the mapping made by validate_source instead of re-reading the file
+        content = self._map_source(path)
+        # Every record from one parse shares a timestamp
+        parsed_at = datetime.now().isoformat()
         
-        if path.suffix.lower() == '.json':
-            return self._parse_json_conversations(content, source_path)
-        else:
-            return self._parse_text_conversations(content, source_path)
+        # Anything without a dedicated parser is treated as plain text
+        handler = getattr(self, self._PARSERS.get(path.suffix.lower(), "_parse_text_conversations"))
+        yield from handler(content, source_path, parsed_at)
     
-    def _parse_json_conversations(self, content: str, source_path: str) -> List[Dict[str, Any]]:
-        """Parse JSON format conversations."""
+    def _map_source(self, path: Path) -> Optional[mmap.mmap]:
+        """
+        Memory-map a source file, reusing the mapping for repeat calls.
+        
+        The mapping is keyed on path, mtime and size so a file that changed
+        between validation and parsing is mapped again. Empty files cannot
+        be mapped and return None.
+        """
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if key == self._source_key and self._source_mm is not None:
+            return self._source_mm
+        
+        # Drop, don't close, the previous mapping: a suspended parse may still
+        # be reading it, and it is unmapped once the last reference goes away
+        self._source_mm = None
+        self._source_key = None
+        if stat.st_size == 0:
+            return None
+        
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        # Parsers walk the file front to back; let the kernel read ahead
+        # so disk reads overlap with decoding
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        
+        self._source_mm = mm
+        self._source_key = key
+        return self._source_mm
+    
+    def _close_source(self):
+        """Release the memory map of the current source, if any."""
+        if self._source_mm is not None:
+            self._source_mm.close()
+        self._source_mm = None
+        self._source_key = None
+    
+    def _parse_json_conversations(
+        self,
+        stream: Optional[mmap.mmap],
+        source_path: str,
+        parsed_at: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Parse JSON format conversations, streaming exports too large to decode at once."""
+        if stream is None:
+            return
+        
+        if len(stream) <= _JSON_WHOLE_PARSE_LIMIT:
+            yield from self._parse_json_whole(stream, source_path, parsed_at)
+            return
+        
+        # Find the first structural byte the same way validate_source does
+        first_char = _NON_WHITESPACE_RE.search(stream)
+        first_byte = first_char.group() if first_char is not None else b''
+        if first_byte not in (b'[', b'{'):
+            self.logger.error("Unsupported top-level JSON value in %s", source_path)
+            return
+        
+        backend = ijson
+        yielded = 0
+        while True:
+            # Each pass gets a private read position so concurrent parses of
+            # the same file don't move each other's place in the shared map
+            reader = _MappedReader(stream)
+            try:
+                if first_byte == b'[':
+                    # Multiple conversations; skip any yielded before a backend switch
+                    items = backend.items(reader, 'item', use_float=True)
+                    for i, conv in enumerate(items):
+                        if i < yielded:
+                            continue
+                        yield self._extract_conversation_as_document(conv, source_path, i, parsed_at)
+                        yielded += 1
+                else:
+                    # Single conversation
+                    conv = dict(backend.kvitems(reader, '', use_float=True))
+                    yield self._extract_conversation_as_document(conv, source_path, 0, parsed_at)
+                return
+                
+            except ijson.JSONError as e:
+                # yajl2_c only handles int64 integers; orjson (used for smaller
+                # exports) accepts larger ones, so retry with the pure-Python backend
+                if backend is ijson and 'integer overflow' in str(e):
+                    self.logger.warning(
+                        "Integer overflow in %s, continuing with the Python JSON backend",
+                        source_path
+                    )
+                    backend = ijson.get_backend('python')
+                    continue
+                self.logger.error("Invalid JSON in %s: %s", source_path, e)
+                return
+    
+    def _parse_json_whole(
+        self,
+        stream: mmap.mmap,
+        source_path: str,
+        parsed_at: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Decode a small JSON export in a single orjson call."""
+        view = memoryview(stream)
         try:
-            data = json.loads(content)
-            conversations = []
-            
-            if isinstance(data, list):
-                # Multiple conversations
-                for i, conv in enumerate(data):
-                    conversations.append(self._extract_conversation_as_document(conv, source_path, i))
-            elif isinstance(data, dict):
-                # Single conversation
-                conversations.append(self._extract_conversation_as_document(data, source_path, 0))
-            
-            return conversations
-            
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in {source_path}: {e}")
-            return []
+            data = orjson.loads(view)
+        except orjson.JSONDecodeError as e:
+            self.logger.error("Invalid JSON in %s: %s", source_path, e)
+            return
+        finally:
+            view.release()
+        
+        if isinstance(data, list):
+            # Multiple conversations
+            for i, conv in enumerate(data):
+                yield self._extract_conversation_as_document(conv, source_path, i, parsed_at)
+        elif isinstance(data, dict):
+            # Single conversation
+            yield self._extract_conversation_as_document(data, source_path, 0, parsed_at)
+        else:
+            self.logger.error("Unsupported top-level JSON value in %s", source_path)
     
-    def _parse_text_conversations(self, content: str, source_path: str) -> List[Dict[str, Any]]:
+    def _parse_text_conversations(
+        self,
+        source: Optional[mmap.mmap],
+        source_path: str,
+        parsed_at: str
+    ) -> Iterator[Dict[str, Any]]:
         """Parse text format conversations."""
+        content = ''
+        if source is not None:
+            # Decode straight from the mapping instead of copying it to bytes first
+            view = memoryview(source)
+            try:
+                content = str(view, 'utf-8')
+            finally:
+                view.release()
+        
         # Treat entire file as one conversation document
         conversation_data = {
             'raw_content': content,
             'source_file': source_path,
             'format': 'text',
-            'parsed_at': datetime.now().isoformat(),
+            'parsed_at': parsed_at,
             'conversation_index': 0
         }
         
-        return [self._extract_conversation_as_document(conversation_data, source_path, 0)]
+        yield self._extract_conversation_as_document(conversation_data, source_path, 0, parsed_at)
     
-    def _extract_conversation_as_document(self, conv_data: Dict, source_path: str, index: int) -> Dict[str, Any]:
+    def _extract_conversation_as_document(
+        self,
+        conv_data: Dict,
+        source_path: str,
+        index: int,
+        parsed_at: str
+    ) -> Dict[str, Any]:
         """Extract conversation and prepare as a document record."""
         # Create document text from conversation
         if 'messages' in conv_data:
@@ -138,7 +384,7 @@ class ClaudeConversationIngestor(BaseIngestor):
             'conversation_index': index,
             'created_at': created_at,
             'updated_at': updated_at,
-            'parsed_at': datetime.now().isoformat(),
+            'parsed_at': parsed_at,
             'format': conv_data.get('format', 'json')
         }
         
@@ -150,23 +396,29 @@ class ClaudeConversationIngestor(BaseIngestor):
     
     def _format_messages_as_text(self, messages: List[Dict]) -> str:
         """Format conversation messages as readable text document."""
-        text_parts = []
+        buf = io.StringIO()
+        # Bind hot-loop lookups to locals once per conversation
+        write = buf.write
+        canonical_role = _ROLE_MAP.get
         
         for msg in messages:
-            role = msg.get('role', 'unknown').title()
-            content = msg.get('content', '')
+            get = msg.get
+            raw_role = get('role', 'unknown')
             
             # Normalize role names
-            if role.lower() in ['human', 'user']:
-                role = 'Human'
-            elif role.lower() in ['assistant', 'claude']:
-                role = 'Assistant'
+            role = canonical_role(raw_role.lower()) or raw_role.title()
             
-            text_parts.append(f"{role}: {content}")
+            write(f"{role}: {get('content', '')}\n\n")
         
-        return "\n\n".join(text_parts)
+        # Drop the separator after the last message
+        return buf.getvalue()[:-2]
+    
+    def _shard_key(self, record: Dict[str, Any]) -> Tuple[str, int]:
+        """Keep each conversation's records together and in order."""
+        metadata = record['metadata']
+        return metadata['source_file'], metadata['conversation_index']
     
-    def transform_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def transform_record(self, record: Dict[str, Any], ingested_at: Optional[str] = None) -> Dict[str, Any]:
         """Transform conversation record for Pixeltable document storage."""
         # Create a temporary text file for Pixeltable to process
         doc_text = record['document_text']
@@ -176,43 +428,70 @@ class ClaudeConversationIngestor(BaseIngestor):
         # Create temporary file
         temp_file = self._create_temp_document(doc_text, title, metadata)
         
-        # Return record formatted for Pixeltable document table
-        transformed = {
+        # Return record formatted for Pixeltable document table. It holds only
+        # table columns so batches can be inserted without copying each row;
+        # pdf_file doubles as the temp file path to clean up after storage
+        # (only paths inside this run's temp directory are ever removed).
+        return {
             'pdf_file': temp_file,  # Pixeltable will process this text file
-            'document_metadata': json.dumps(metadata),  # Store our metadata
-            'ingested_at': datetime.now().isoformat()
+            'document_metadata': orjson.dumps(metadata).decode(),  # Store our metadata
+            'ingested_at': ingested_at or datetime.now().isoformat()
         }
-        
-        # Store temp file path for cleanup later
-        transformed['_temp_file_path'] = temp_file
-        
-        return transformed
+    
+    def _get_temp_doc_dir(self) -> Path:
+        """Return this run's temp document directory, creating it on first use."""
+        if self._temp_doc_dir is None:
+            with self._temp_doc_dir_lock:
+                if self._temp_doc_dir is None:
+                    base_dir = Path(tempfile.gettempdir()) / "takeout_ingestor_docs"
+                    base_dir.mkdir(exist_ok=True)
+                    self._temp_doc_dir = Path(tempfile.mkdtemp(prefix="run_", dir=base_dir))
+        return self._temp_doc_dir
     
     def _create_temp_document(self, text: str, title: str, metadata: Dict) -> str:
         """Create a temporary text file for Pixeltable to process."""
         # Create temp file with meaningful name
-        safe_title = re.sub(r'[^\w\-_\.]', '_', title)[:50]
+        safe_title = title[:50].translate(_SAFE_TITLE_TABLE)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        temp_dir = Path(tempfile.gettempdir()) / "takeout_ingestor_docs"
-        temp_dir.mkdir(exist_ok=True)
+        temp_dir = self._get_temp_doc_dir()
         
-        temp_file = temp_dir / f"claude_conv_{timestamp}_{safe_title}.txt"
+        # mkstemp keeps names unique when batches are transformed concurrently
+        prefix = f"claude_conv_{timestamp}_{safe_title}_"
+        try:
+            fd, temp_file = tempfile.mkstemp(prefix=prefix, suffix=".txt", dir=temp_dir)
+        except FileNotFoundError:
+            # The stale-run sweep (or a tmp cleaner) removed an idle run's
+            # directory; recreate it in place and try again
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_file = tempfile.mkstemp(prefix=prefix, suffix=".txt", dir=temp_dir)
         
-        # Write document with metadata header
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            f.write(f"Title: {title}\n")
-            f.write(f"Source: {metadata.get('source_type', 'unknown')}\n")
-            if metadata.get('created_at'):
-                f.write(f"Created: {metadata['created_at']}\n")
-            f.write(f"Parsed: {metadata['parsed_at']}\n")
-            f.write("\n" + "="*50 + "\n\n")
-            f.write(text)
+        # Build the document with its metadata header and write it in one call
+        created = f"Created: {metadata['created_at']}\n" if metadata.get('created_at') else ""
+        content = (
+            f"Title: {title}\n"
+            f"Source: {metadata.get('source_type', 'unknown')}\n"
+            f"{created}"
+            f"Parsed: {metadata['parsed_at']}\n"
+            f"{_HEADER_SEPARATOR}"
+            f"{text}"
+        )
+        with open(fd, 'wb') as f:
+            f.write(content.encode('utf-8'))
         
-        return str(temp_file)
+        return temp_file
     
     def _ensure_pixeltable_schema(self):
         """Ensure the unified documents table exists in Pixeltable."""
+        if self._schema_ready:
+            # Already set up by an earlier ingest on this instance
+            return
+        
+        # Imported here so loading the ingestor doesn't pay for Pixeltable/HF
+        import pixeltable as pxt
+        from pixeltable.iterators import DocumentSplitter
+        from pixeltable.functions.huggingface import sentence_transformer
+        
         try:
             # Create directory if not exists
             pxt.create_dir('doc_search', if_exists='ignore')
@@ -230,6 +509,7 @@ class ClaudeConversationIngestor(BaseIngestor):
                 schema,
                 if_exists='ignore'
             )
+            self._table = table
             
             # Create view for document chunks (Pixeltable's document processing)
             chunks_view_name = 'doc_search.all_documents_chunks'
@@ -253,46 +533,92 @@ class ClaudeConversationIngestor(BaseIngestor):
                     if_exists='ignore'
                 )
                 
+                self._schema_ready = True
                 self.logger.info("Unified documents table schema ready")
                 
             except Exception as e:
-                self.logger.warning(f"Chunks view might already exist: {e}")
+                self.logger.warning("Chunks view might already exist: %s", e)
                 
         except Exception as e:
-            self.logger.error(f"Error setting up Pixeltable schema: {e}")
+            self.logger.error("Error setting up Pixeltable schema: %s", e)
             raise
     
     def _store_pixeltable(self, record: Dict[str, Any]):
         """Store document record in Pixeltable."""
         try:
-            table = self.pixeltable_client.get_table('doc_search.all_documents')
-            
-            # Remove temp file path before storing
-            store_record = {k: v for k, v in record.items() if not k.startswith('_')}
-            table.insert([store_record])
+            self._table.insert([record])
             
             # Clean up temp file after successful storage
-            temp_file = record.get('_temp_file_path')
-            if temp_file and Path(temp_file).exists():
-                try:
-                    Path(temp_file).unlink()
-                except Exception as e:
-                    self.logger.warning(f"Could not clean up temp file {temp_file}: {e}")
+            self._remove_temp_files([record])
                     
         except Exception as e:
-            self.logger.error(f"Error storing record in Pixeltable: {e}")
+            self.logger.error("Error storing record in Pixeltable: %s", e)
             raise
     
+    def _store_pixeltable_batch(self, records: List[Dict[str, Any]]):
+        """Store a batch of document records with a single Pixeltable insert."""
+        self._table.insert(records)
+        
+        # Clean up temp files after successful storage
+        self._remove_temp_files(records)
+    
+    def _remove_temp_files(self, records: List[Dict[str, Any]]):
+        """Delete the temporary document files backing stored records."""
+        temp_dir = self._temp_doc_dir
+        if temp_dir is None:
+            return
+        
+        # Only files this run created are removed; never a user's own document
+        temp_dir = str(temp_dir)
+        for record in records:
+            temp_file = record.get('pdf_file')
+            if not temp_file or os.path.dirname(temp_file) != temp_dir:
+                continue
+            try:
+                # Unlink directly rather than stat-ing first: one syscall per file
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning("Could not clean up temp file %s: %s", temp_file, e)
+    
     def cleanup(self):
         """Clean up any remaining temporary files."""
         super().cleanup()
         
-        # Clean up temp directory
-        temp_dir = Path(tempfile.gettempdir()) / "takeout_ingestor_docs"
-        if temp_dir.exists():
+        self._table = None
+        self._schema_ready = False
+        self._close_source()
+        
+        # Clean up this run's temp directory
+        temp_dir, self._temp_doc_dir = self._temp_doc_dir, None
+        if temp_dir is not None:
             try:
-                import shutil
                 shutil.rmtree(temp_dir)
                 self.logger.info("Cleaned up temporary document files")
             except Exception as e:
-                self.logger.warning(f"Could not clean up temp directory: {e}")
+                self.logger.warning("Could not clean up temp directory: %s", e)
+            
+            # Sweep run directories left by ingestors that were never cleaned
+            # up, then drop the shared parent once no other run is using it
+            self._remove_stale_run_dirs(temp_dir.parent)
+            try:
+                temp_dir.parent.rmdir()
+            except OSError:
+                pass
+    
+    def _remove_stale_run_dirs(self, base_dir: Path):
+        """Delete run directories nothing has written to in a long while."""
+        cutoff = time.time() - _STALE_RUN_DIR_AGE
+        try:
+            run_dirs = list(base_dir.glob("run_*"))
+        except OSError:
+            return
+        
+        for run_dir in run_dirs:
+            try:
+                # A live run touches its directory with every document it writes
+                if run_dir.stat().st_mtime < cutoff:
+                    shutil.rmtree(run_dir)
+            except OSError as e:
+                self.logger.warning("Could not remove stale temp directory %s: %s", run_dir, e)
@@ -2,27 +2,19 @@
 Test Claude Conversation Ingestor with actual Pixeltable storage
 """
 
-import sys
 import os
+import tempfile
 from pathlib import Path
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+import pytest
 
-# Load environment variables
-from dotenv import load_dotenv
-load_dotenv()
-
-def test_full_claude_ingestion():
+@pytest.mark.usefixtures("ensure_tables")
+def test_full_claude_ingestion(claude_ingestor):
     """Test full Claude conversation ingestion into Pixeltable."""
     print("🔄 Testing Claude Conversation Ingestor with Pixeltable...")
     
-    try:
-        from takeout_ingestor.ingestors.claude_conversations import ClaudeConversationIngestor
-        
-        # Create a more interesting sample conversation
-        sample_conversation = """Human: I'm working on a data ingestion project using Pixeltable. Can you help me understand the best practices?
+    # Create a more interesting sample conversation
+    sample_conversation = """Human: I'm working on a data ingestion project using Pixeltable. Can you help me understand the best practices?
 
 Assistant: Absolutely! Here are some key best practices for data ingestion with Pixeltable:
 
@@ -62,17 +54,16 @@ Assistant: Great choice! Google Takeout can contain massive amounts of valuable
 - Implement resume functionality for long-running jobs
 
 Would you like me to dive deeper into any of these areas?"""
-        
-        # Write to temporary file
-        temp_file = project_root / "temp_claude_conversation.txt"
-        temp_file.write_text(sample_conversation)
-        
+    
+    # Write to a temporary file outside the repo
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=".txt", delete=False) as tf:
+        tf.write(sample_conversation.encode('utf-8'))
+    temp_file = Path(tf.name)
+    
+    try:
         # Test ingestor with actual Pixeltable storage
-        print("📝 Creating ingestor...")
-        ingestor = ClaudeConversationIngestor(
-            batch_size=10,
-            pixeltable_home=os.getenv('PIXELTABLE_HOME')
-        )
+        print("📝 Using shared ingestor...")
+        ingestor = claude_ingestor
         
         # Run full ingestion (this will actually store in Pixeltable)
         print("💾 Running ingestion...")
@@ -84,18 +75,16 @@ Would you like me to dive deeper into any of these areas?"""
         print(f"  Failed: {result['failed_records']}")
         print(f"  Success rate: {result['success_rate']:.1f}%")
         print(f"  Table: {result['table_name']}")
-        
-        # Cleanup
-        temp_file.unlink(missing_ok=True)
-        
-        print("✅ Claude conversation successfully ingested into Pixeltable!")
-        print("\n🔍 You can now query this data via the MCP server!")
-        print("Try asking: 'What conversations do I have about data ingestion?'")
-        
-    except Exception as e:
-        print(f"❌ Ingestion failed: {e}")
-        import traceback
-        traceback.print_exc()
+        assert result['failed_records'] == 0
+    finally:
+        os.unlink(temp_file)
+    
+    print("✅ Claude conversation successfully ingested into Pixeltable!")
+    print("\n🔍 You can now query this data via the MCP server!")
+    print("Try asking: 'What conversations do I have about data ingestion?'")
 
 if __name__ == "__main__":
-    test_full_claude_ingestion()
\ No newline at end of file
+    from dotenv import load_dotenv
+    load_dotenv()
+    from conftest import make_claude_ingestor
+    test_full_claude_ingestion(make_claude_ingestor())
\ No newline at end of file
@@ -9,10 +9,6 @@ import json
 import re
 from datetime import datetime
 
-# Add the project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
 def test_claude_parsing():
     """Test Claude conversation parsing logic without Pixeltable."""
     print("Testing Claude Conversation Parsing Logic...")